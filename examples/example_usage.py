@@ -12,6 +12,7 @@ Usage:
 
 import asyncio
 import logging
+import sys
 from typing import Dict, List, Any
 
 # Import ADCA core components
@@ -52,6 +53,10 @@ class MockMemoryClient:
     def get_world_state(self, key):
         return self.world_state.get(key)
         
+    def batch(self, items):
+        for op, key, value in items:
+            getattr(self, op)(key, value)
+        
     def search_short_term(self, query, limit=10):
         print(f"[MEMORY] Searching short-term for: {query}")
         return []
@@ -62,11 +67,15 @@ class MockMemoryClient:
 
 # Example custom agent
 class SimpleCodeAgent(Agent):
+    __slots__ = ()
+    
     def __init__(self, name, memory_client):
         super().__init__(
             name=name,
             capabilities=["code_generation"],
-            memory_client=memory_client
+            memory_client=memory_client,
+            # The in-process mock never fails, so skip the error guards
+            guard_memory=False
         )
         
     async def execute(self):
@@ -154,4 +163,17 @@ async def run_example():
     print("\nExample completed. In a real scenario, the system would continue running.")
 
 if __name__ == "__main__":
-    asyncio.run(run_example())
+    # Use the libuv-based event loop where available, as main.run() does
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+        
+    if uvloop is None:
+        asyncio.run(run_example())
+    elif sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(run_example())
+    else:
+        uvloop.install()
+        asyncio.run(run_example())
@@ -12,9 +12,14 @@ setup(
         "aiohttp>=3.8.0",
         "pydantic>=2.0.0",
         "python-dotenv>=1.0.0",
-        "anthropic>=0.6.0"
+        "anthropic>=0.6.0",
+        "uvloop>=0.17.0; sys_platform != 'win32'"
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.8.0",
+            "ijson>=3.1.0"
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.20.0",
@@ -0,0 +1,9 @@
+"""
+Run the system with ``python -m core`` from the ``src`` directory.
+
+Equivalent to ``python main.py``.
+"""
+
+from main import run
+
+run()
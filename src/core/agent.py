@@ -1,72 +1,151 @@
-import uuid
+import itertools
 import logging
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional
+
+from .events import ProgressEvent, ProgressQueue
+from .utils import RUN_ID, now_iso
+
+# Source of agent ID suffixes; cheaper than a uuid4 per agent
+_agent_counter = itertools.count()
 
 class Agent:
     """Base class for all agents in the system.
     
     Provides common functionality for task handling, memory operations,
     and progress reporting.
+    
+    Instances use ``__slots__``. Subclasses should declare their own
+    ``__slots__`` (an empty tuple if they add no attributes) to keep that
+    benefit; otherwise they get a regular instance ``__dict__``.
     """
     
-    def __init__(self, name: str, capabilities: List[str], memory_client: Any):
+    __slots__ = (
+        "name",
+        "id",
+        "capabilities",
+        "capabilities_set",
+        "memory_client",
+        "guard_memory",
+        "current_task",
+        "status",
+        "logger",
+        "on_progress",
+        "progress_queue",
+    )
+    
+    # Loggers shared by agents with the same name
+    _LOGGERS: ClassVar[Dict[str, logging.Logger]] = {}
+    
+    def __init__(
+        self,
+        name: str,
+        capabilities: List[str],
+        memory_client: Any,
+        guard_memory: bool = True,
+    ):
         """Initialize a new agent.
         
         Args:
             name: Unique identifier for the agent
             capabilities: List of tasks this agent can perform
             memory_client: Client for MTMA operations
+            guard_memory: Catch and log memory client errors. Pass False for
+                local clients that cannot fail, so errors propagate to the
+                orchestrator's per-cycle error handling instead
         """
         self.name = name
-        self.id = f"{name.lower().replace(' ', '_')}_{uuid.uuid4().hex[:8]}"
+        self.id = f"{name.lower().replace(' ', '_')}_{RUN_ID}-a{next(_agent_counter):x}"
         self.capabilities = capabilities
+        self.capabilities_set = frozenset(capabilities)
         self.memory_client = memory_client
+        self.guard_memory = guard_memory
         self.current_task = None
         self.status = "idle"
-        self.logger = logging.getLogger(f"agent.{self.name}")
+        
+        logger = Agent._LOGGERS.get(name)
+        if logger is None:
+            logger = Agent._LOGGERS[name] = logging.getLogger(f"agent.{name}")
+        self.logger = logger
+        
+        # Set by the orchestrator on registration so progress is delivered
+        # directly instead of being polled from world state
+        self.on_progress: Optional[Callable[[ProgressEvent], Awaitable[None]]] = None
+        
+        # Set by the orchestrator on registration; used by report_progress_sync
+        # so agents on worker threads can hand progress over safely
+        self.progress_queue: Optional[ProgressQueue] = None
         
     async def assign_task(self, task: Dict[str, Any]) -> bool:
         """Assign a new task to this agent.
         
+        Thin wrapper around ``assign_task_sync``, kept for callers that expect
+        a coroutine. The orchestrator calls ``assign_task_sync`` directly
+        unless a subclass overrides this method, in which case the override
+        is awaited instead.
+        
         Args:
             task: Task details including ID, description, and requirements
             
         Returns:
             bool: True if task was successfully assigned, False otherwise
         """
+        return self.assign_task_sync(task)
+        
+    def assign_task_sync(self, task: Dict[str, Any]) -> bool:
+        """Assign a new task to this agent without going through the event loop.
+        
+        Assignment only writes to the memory client, whose methods are
+        synchronous, so there is nothing to await.
+        
+        Args:
+            task: Task details including ID, description, and requirements
+            
+        Returns:
+            bool: True if task was successfully assigned, False otherwise
+        """
+        task_id = task["id"]
+        
         # Check if agent is already busy
         if self.status != "idle":
-            self.logger.warning(f"Cannot assign task {task['id']}: Agent is {self.status}")
+            self.logger.warning(f"Cannot assign task {task_id}: Agent is {self.status}")
             return False
             
         # Check if agent has required capabilities
         required_capabilities = task.get("required_capabilities", [])
-        if required_capabilities and not all(cap in self.capabilities for cap in required_capabilities):
-            self.logger.warning(f"Cannot assign task {task['id']}: Missing required capabilities")
+        if required_capabilities and not self.capabilities_set.issuperset(required_capabilities):
+            self.logger.warning(f"Cannot assign task {task_id}: Missing required capabilities")
             return False
         
         # Store task in agent's memory
-        try:
-            self.memory_client.store_short_term(f"task:{task['id']}", task)
-            self.current_task = task
-            self.status = "working"
-            self.logger.info(f"Assigned task {task['id']} to agent {self.name}")
-            
-            # Update world state with assignment
-            self.memory_client.update_world_state(
-                f"task_assignment:{task['id']}",
-                {
-                    "agent": self.id,
-                    "assigned_at": datetime.now().isoformat(),
-                    "status": "assigned"
-                }
-            )
-            
-            return True
-        except Exception as e:
-            self.logger.error(f"Failed to assign task {task['id']}: {str(e)}")
+        if not self._safe_memory_call(f"assign task {task_id}", False, self._store_assignment, task):
             return False
+            
+        self.current_task = task
+        self.status = "working"
+        self.logger.info(f"Assigned task {task_id} to agent {self.name}")
+        return True
+        
+    def _store_assignment(self, task: Dict[str, Any]) -> bool:
+        """Write a task assignment to short-term memory and world state.
+        
+        Args:
+            task: Task details including ID, description, and requirements
+            
+        Returns:
+            bool: Always True; errors are raised to the caller
+        """
+        self.memory_client.store_short_term(f"task:{task['id']}", task)
+        
+        # Update world state with assignment
+        self.memory_client.update_world_state(
+            f"task_assignment:{task['id']}",
+            {
+                "agent": self.id,
+                "assigned_at": now_iso(),
+                "status": "assigned"
+            }
+        )
+        return True
         
     async def execute(self) -> None:
         """Execute the current task.
@@ -81,31 +160,76 @@ class Agent:
         Args:
             progress: Dictionary containing progress information
         """
-        if not self.current_task:
-            self.logger.warning("Cannot report progress: No task assigned")
+        event = self._record_progress(progress)
+        if event is None:
             return
             
-        try:
-            # Add timestamp and agent info
-            progress["reported_at"] = datetime.now().isoformat()
-            progress["agent"] = self.id
-            
-            # Update task progress in world state
-            self.memory_client.update_world_state(
-                f"task_progress:{self.current_task['id']}", 
-                progress
-            )
+        # Hand the report straight to the orchestrator
+        if self.on_progress is not None:
+            await self.on_progress(event)
+        else:
+            self._store_progress(event)
             
-            self.logger.info(f"Reported progress for task {self.current_task['id']}: {progress['status']}")
+    def report_progress_sync(self, progress: Dict[str, Any]) -> Optional[str]:
+        """Report task progress without awaiting the orchestrator.
+        
+        Safe to call from a worker thread: the report is put on the
+        orchestrator's progress queue and picked up on its next cycle.
+        
+        Args:
+            progress: Dictionary containing progress information
             
-            # If task is completed or failed, update agent status
-            if progress.get("status") in ["completed", "failed"]:
-                self.status = "idle"
-                self.current_task = None
-                
-        except Exception as e:
-            self.logger.error(f"Failed to report progress: {str(e)}")
-    
+        Returns:
+            ID of the task the progress was recorded for, or None on failure
+        """
+        event = self._record_progress(progress)
+        if event is None:
+            return None
+            
+        if self.progress_queue is None or not self.progress_queue.put(event):
+            # Fall back to world state, where the orchestrator's sweep finds it
+            self._store_progress(event)
+            
+        return event.task_id
+        
+    def _record_progress(self, progress: Dict[str, Any]) -> Optional[ProgressEvent]:
+        """Build a progress event and update the agent's own state.
+        
+        Args:
+            progress: Dictionary containing progress information
+            
+        Returns:
+            The progress event, or None if no task is assigned
+        """
+        if not self.current_task:
+            self.logger.warning("Cannot report progress: No task assigned")
+            return None
+            
+        event = ProgressEvent.from_report(self.current_task["id"], self.id, now_iso(), progress)
+        
+        self.logger.info(f"Reported progress for task {event.task_id}: {event.status}")
+        
+        # If task is completed or failed, update agent status
+        if event.status in ["completed", "failed"]:
+            self.status = "idle"
+            self.current_task = None
+            
+        return event
+        
+    def _store_progress(self, event: ProgressEvent) -> None:
+        """Write a progress report to world state.
+        
+        Args:
+            event: Progress event to store
+        """
+        self._safe_memory_call(
+            "report progress",
+            None,
+            self.memory_client.update_world_state,
+            f"task_progress:{event.task_id}",
+            event.to_dict()
+        )
+        
     async def get_context(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
         """Retrieve context relevant to the current task.
         
@@ -116,19 +240,51 @@ class Agent:
         Returns:
             List of context items
         """
+        return self._safe_memory_call("get context", [], self._search_context, query, limit)
+        
+    def _search_context(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        """Search short-term memory, then long-term memory, for context.
+        
+        Args:
+            query: Search query for finding relevant context
+            limit: Maximum number of context items to retrieve
+            
+        Returns:
+            List of context items
+        """
+        # Search in short-term memory first
+        results = self.memory_client.search_short_term(query, limit=limit)
+        
+        # If not enough results, search in long-term memory
+        if len(results) < limit:
+            long_term_results = self.memory_client.search_long_term(
+                query, 
+                limit=limit - len(results)
+            )
+            results.extend(long_term_results)
+            
+        return results
+        
+    def _safe_memory_call(self, action: str, default: Any, func: Callable[..., Any], *args: Any) -> Any:
+        """Call into the memory client, containing errors if it is fallible.
+        
+        With ``guard_memory`` disabled the call is made directly and errors
+        propagate to the caller.
+        
+        Args:
+            action: Description of the operation, used in the error log
+            default: Value returned if the call fails
+            func: Memory operation to call
+            *args: Arguments for the operation
+            
+        Returns:
+            Result of the call, or default if it failed
+        """
+        if not self.guard_memory:
+            return func(*args)
+            
         try:
-            # Search in short-term memory first
-            results = self.memory_client.search_short_term(query, limit=limit)
-            
-            # If not enough results, search in long-term memory
-            if len(results) < limit:
-                long_term_results = self.memory_client.search_long_term(
-                    query, 
-                    limit=limit - len(results)
-                )
-                results.extend(long_term_results)
-                
-            return results
+            return func(*args)
         except Exception as e:
-            self.logger.error(f"Failed to get context: {str(e)}")
-            return []
+            self.logger.error(f"Failed to {action}: {str(e)}")
+            return default
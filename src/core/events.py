@@ -0,0 +1,126 @@
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, Optional
+
+@dataclass(slots=True)
+class ProgressEvent:
+    """A progress report from an agent about its current task.
+    
+    Built once by the agent and passed as-is to the orchestrator, which
+    serializes it once with ``to_dict`` for storage.
+    """
+    
+    task_id: str
+    agent_id: str
+    status: Optional[str]
+    reported_at: str
+    output: Any = None
+    message: Optional[str] = None
+    details: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_report(cls, task_id: str, agent_id: str, reported_at: str, progress: Dict[str, Any]) -> 'ProgressEvent':
+        """Create an event from a progress dictionary as passed to ``report_progress``.
+        
+        Args:
+            task_id: ID of the task the progress belongs to
+            agent_id: ID of the reporting agent
+            reported_at: Time of the report
+            progress: Progress information; keys other than status, output
+                and message are kept in ``details``
+            
+        Returns:
+            ProgressEvent instance
+        """
+        details = {
+            key: value for key, value in progress.items()
+            if key not in ("status", "output", "message")
+        }
+        return cls(
+            task_id=task_id,
+            agent_id=agent_id,
+            status=progress.get("status"),
+            reported_at=reported_at,
+            output=progress.get("output"),
+            message=progress.get("message"),
+            details=details
+        )
+        
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the event to the progress record stored in memory.
+        
+        Returns:
+            Dictionary representation of the progress report
+        """
+        data = dict(self.details)
+        data["status"] = self.status
+        if self.output is not None:
+            data["output"] = self.output
+        if self.message is not None:
+            data["message"] = self.message
+        data["reported_at"] = self.reported_at
+        data["agent"] = self.agent_id
+        return data
+        
+
+class ProgressQueue:
+    """Queue carrying progress reports from agent threads to the orchestrator.
+    
+    Agents on any number of worker threads put events and the orchestrator,
+    as the only consumer, drains them. Producers share a lock so the capacity
+    check and append happen together and the bound is exact. The consumer
+    takes no lock: ``deque.popleft`` is atomic in CPython and only ever
+    shrinks the queue, so it cannot push it past capacity.
+    
+    ``waker``, when set, is called after every successful put so the
+    consumer can be woken from the producer's thread.
+    """
+    
+    __slots__ = ("_items", "_put_lock", "capacity", "waker")
+    
+    def __init__(self, capacity: Optional[int] = 1024):
+        """Initialize a new progress queue.
+        
+        Args:
+            capacity: Maximum number of queued events, or None for no limit
+        """
+        self._items: Deque[ProgressEvent] = deque()
+        self._put_lock = threading.Lock()
+        self.capacity = capacity
+        self.waker: Optional[Callable[[], None]] = None
+        
+    def put(self, event: ProgressEvent) -> bool:
+        """Add an event to the queue.
+        
+        Args:
+            event: Event to add
+            
+        Returns:
+            True if the event was queued, False if the queue is full
+        """
+        if self.capacity is None:
+            self._items.append(event)
+        else:
+            with self._put_lock:
+                if len(self._items) >= self.capacity:
+                    return False
+                self._items.append(event)
+                
+        waker = self.waker
+        if waker is not None:
+            waker()
+        return True
+        
+    def consume_all(self) -> Iterator[ProgressEvent]:
+        """Remove and yield every queued event in arrival order.
+        
+        Yields:
+            Queued events
+        """
+        items = self._items
+        while items:
+            yield items.popleft()
+            
+    def __len__(self) -> int:
+        return len(self._items)
@@ -0,0 +1,57 @@
+from typing import Any, List, Optional, Protocol, Tuple
+
+# A deferred write: (method name, key, value), e.g. ("store_long_term", key, value)
+WriteOp = Tuple[str, str, Any]
+
+class MemoryClient(Protocol):
+    """Interface the core framework expects from an MTMA client.
+    
+    Agents and the orchestrator only rely on these methods, so any object
+    providing them (the real MTMA client, or a mock during development)
+    can be used.
+    """
+    
+    def store_short_term(self, key: str, value: Any, ttl: int = 3600, lock: bool = False) -> None:
+        """Store a value in short-term memory."""
+        ...
+        
+    def get_short_term(self, key: str) -> Optional[Any]:
+        """Get a value from short-term memory."""
+        ...
+        
+    def store_long_term(self, key: str, value: Any) -> None:
+        """Store a value in long-term memory.
+        
+        Values are plain dicts, or JSON bytes (see ``Task.to_json``) for
+        clients that persist outside the process.
+        """
+        ...
+        
+    def get_long_term(self, key: str) -> Optional[Any]:
+        """Get a value from long-term memory."""
+        ...
+        
+    def update_world_state(self, key: str, value: Any) -> None:
+        """Update a value in world state."""
+        ...
+        
+    def get_world_state(self, key: str) -> Optional[Any]:
+        """Get a value from world state."""
+        ...
+        
+    def search_short_term(self, query: str, limit: int = 10) -> List[Any]:
+        """Search in short-term memory."""
+        ...
+        
+    def search_long_term(self, query: str, limit: int = 10) -> List[Any]:
+        """Search in long-term memory."""
+        ...
+        
+    def batch(self, items: List[WriteOp]) -> None:
+        """Apply several writes in a single call.
+        
+        Args:
+            items: Writes as (op, key, value) tuples, where op names one of
+                the write methods above
+        """
+        ...
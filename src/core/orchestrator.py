@@ -1,10 +1,15 @@
 import asyncio
+import functools
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+import time
+from collections import defaultdict
+from typing import AbstractSet, Dict, Iterable, List, Any, Optional, Set
 
 from .agent import Agent
+from .events import ProgressEvent, ProgressQueue
+from .memory import WriteOp
 from .task import Task, TaskQueue
+from .utils import now_iso
 
 class TaskOrchestrator:
     """Central component responsible for managing tasks and agents.
@@ -13,17 +18,38 @@ class TaskOrchestrator:
     agents, and monitors task execution.
     """
     
-    def __init__(self, memory_client: Any):
+    def __init__(self, memory_client: Any, wake_event: Optional[asyncio.Event] = None):
         """Initialize the task orchestrator.
         
         Args:
             memory_client: Client for MTMA operations
+            wake_event: Event that starts the next run() cycle early when set;
+                created if not given. Callers can set it when they add work
+                the orchestrator can't see.
         """
         self.memory_client = memory_client
         self.agents: Dict[str, Agent] = {}
         self.task_queue = TaskQueue()
         self.logger = logging.getLogger("orchestrator")
         
+        # Memory writes deferred until the end of the current step
+        self._pending_writes: List[WriteOp] = []
+        
+        # Progress reported by agents outside the event loop
+        self.progress_events = ProgressQueue()
+        
+        # Index of idle agents by capability, refreshed from agent status
+        self._idle_agents: Set[str] = set()
+        self._idle_by_cap: Dict[str, Set[str]] = defaultdict(set)
+        self._indexed_status: Dict[str, str] = {}
+        self.agent_status_counts: Dict[str, int] = {}
+        
+        # Task currently assigned to each agent, by agent ID
+        self._assignments: Dict[str, str] = {}
+        
+        # Set when new work arrives so run() starts its next cycle early
+        self.wake_event = wake_event if wake_event is not None else asyncio.Event()
+        
     def register_agent(self, agent: Agent) -> None:
         """Register an agent with the orchestrator.
         
@@ -31,8 +57,35 @@ class TaskOrchestrator:
             agent: Agent to register
         """
         self.agents[agent.id] = agent
+        self._attach_agent(agent)
+        self.wake_event.set()
         self.logger.info(f"Registered agent {agent.name} with ID {agent.id}")
         
+    def register_agents(self, agents: Iterable[Agent]) -> None:
+        """Register several agents with the orchestrator at once.
+        
+        Args:
+            agents: Agents to register
+        """
+        agents = list(agents)
+        self.agents.update({agent.id: agent for agent in agents})
+        for agent in agents:
+            self._attach_agent(agent)
+            
+        if agents:
+            self.wake_event.set()
+        self.logger.info(f"Registered {len(agents)} agents")
+        
+    def _attach_agent(self, agent: Agent) -> None:
+        """Index a newly registered agent and route its progress reports here.
+        
+        Args:
+            agent: Registered agent
+        """
+        self._index_agent(agent)
+        agent.on_progress = self._handle_progress
+        agent.progress_queue = self.progress_events
+        
     def create_task(
         self,
         description: str,
@@ -66,6 +119,7 @@ class TaskOrchestrator:
         
         # Add to queue
         task_id = self.task_queue.add_task(task)
+        self.wake_event.set()
         
         # Store in memory
         self.memory_client.store_long_term(f"task:{task_id}", task.to_dict())
@@ -76,154 +130,365 @@ class TaskOrchestrator:
     async def assign_tasks(self) -> int:
         """Assign pending tasks to available agents.
         
+        Ready tasks are visited in priority order and each is matched against
+        the idle-agent capability index, instead of asking the queue for a
+        task once per idle agent.
+        
         Returns:
             Number of tasks assigned
         """
         assigned_count = 0
         
-        for agent in self.agents.values():
-            if agent.status != "idle":
-                continue
+        # Bind hot attributes to locals for the loop below
+        idle_agents = self._idle_agents
+        if not idle_agents:
+            self._flush_writes()
+            return 0
+            
+        agents = self.agents
+        find_idle_agents = self._find_idle_agents
+        index_agent = self._index_agent
+        update_task = self.task_queue.update_task
+        assignments = self._assignments
+        
+        ready = self.task_queue.ready_tasks()
+        try:
+            for task in ready:
+                # Find idle agents with every required capability
+                candidates = find_idle_agents(task.required_capabilities_set)
+                if not candidates:
+                    continue
+                    
+                task_data = task.to_dict()
+                for agent_id in list(candidates):
+                    agent = agents[agent_id]
+                    
+                    # Assign task to agent, awaiting subclasses that still
+                    # customize the coroutine instead of assign_task_sync
+                    if type(agent).assign_task is Agent.assign_task:
+                        success = agent.assign_task_sync(task_data)
+                    else:
+                        success = await agent.assign_task(task_data)
+                    if success:
+                        update_task(task.id, {
+                            "status": "assigned",
+                            "assigned_to": agent.id
+                        })
+                        assignments[agent.id] = task.id
+                        assigned_count += 1
+                        
+                    # Either way the agent's status may have changed
+                    index_agent(agent)
+                    if success:
+                        break
+                        
+                if not idle_agents:
+                    break
+        finally:
+            ready.close()
+            
+        self._flush_writes()
+        return assigned_count
+        
+    def _find_idle_agents(self, required_capabilities: AbstractSet[str]) -> Set[str]:
+        """Find idle agents that have all of the given capabilities.
+        
+        Args:
+            required_capabilities: Capabilities needed by a task
+            
+        Returns:
+            Set of matching idle agent IDs
+        """
+        if not required_capabilities:
+            return self._idle_agents
+            
+        # Find the smallest group in the same pass instead of sorting them all
+        smallest: Optional[Set[str]] = None
+        others = []
+        for cap in required_capabilities:
+            agent_ids = self._idle_by_cap.get(cap)
+            if not agent_ids:
+                return set()
+            if smallest is None:
+                smallest = agent_ids
+            elif len(agent_ids) < len(smallest):
+                others.append(smallest)
+                smallest = agent_ids
+            else:
+                others.append(agent_ids)
                 
-            # Find suitable task
-            task = self.task_queue.get_next_task(agent.capabilities)
-            if not task:
-                continue
+        return smallest.intersection(*others)
+        
+    def _refresh_agent_index(self) -> None:
+        """Re-index agents whose status changed since they were last seen."""
+        for agent in self.agents.values():
+            if agent.status != self._indexed_status.get(agent.id):
+                self._index_agent(agent)
                 
-            # Assign task to agent
-            success = await agent.assign_task(task.to_dict())
-            if success:
-                task.status = "assigned"
-                task.assigned_to = agent.id
-                self.task_queue.update_task(task.id, {
-                    "status": "assigned",
-                    "assigned_to": agent.id
-                })
-                assigned_count += 1
+    def _index_agent(self, agent: Agent) -> None:
+        """Record an agent's current status in the idle index and counters.
+        
+        This is the single place agent status transitions are recorded, so
+        ``agent_status_counts`` stays in step with the index.
+        
+        Args:
+            agent: Agent whose status should be reflected in the index
+        """
+        old_status = self._indexed_status.get(agent.id)
+        if old_status is not None:
+            self.agent_status_counts[old_status] -= 1
+        self.agent_status_counts[agent.status] = self.agent_status_counts.get(agent.status, 0) + 1
+        self._indexed_status[agent.id] = agent.status
+        
+        if agent.status == "idle":
+            self._idle_agents.add(agent.id)
+            for cap in agent.capabilities_set:
+                self._idle_by_cap[cap].add(agent.id)
+        else:
+            self._idle_agents.discard(agent.id)
+            for cap in agent.capabilities_set:
+                self._idle_by_cap[cap].discard(agent.id)
                 
-        return assigned_count
+    async def _handle_progress(self, event: ProgressEvent) -> None:
+        """Handle a progress report delivered directly by an agent.
+        
+        Args:
+            event: Progress event reported by the agent
+        """
+        self.wake_event.set()
+        if self._apply_progress(event):
+            # The reporting agent is idle again and dependents may be unlocked
+            await self.assign_tasks()
+        else:
+            self._flush_writes()
+            
+    def _apply_progress(self, event: ProgressEvent) -> bool:
+        """Record a progress report and act on it if the task has finished.
+        
+        The event is serialized once; the same record is stored in world
+        state and, for finished tasks, as the task result.
+        
+        Args:
+            event: Progress event reported by the agent
+            
+        Returns:
+            True if the task completed or failed
+        """
+        progress = event.to_dict()
+        self._pending_writes.append(("update_world_state", f"task_progress:{event.task_id}", progress))
+        
+        if event.status == "completed":
+            self.handle_completed_task(event.task_id, progress)
+        elif event.status == "failed":
+            self.handle_failed_task(event.task_id, progress)
+        else:
+            return False
+            
+        agent = self.agents.get(event.agent_id)
+        if agent is not None:
+            self._index_agent(agent)
+        return True
+        
+    def drain_progress_events(self) -> int:
+        """Apply progress reports queued by agents outside the event loop.
+        
+        Returns:
+            Number of reports that finished a task
+        """
+        finished = 0
+        for event in self.progress_events.consume_all():
+            if self._apply_progress(event):
+                finished += 1
+        return finished
         
     async def monitor_progress(self) -> None:
-        """Monitor progress of running tasks."""
-        for agent_id, agent in self.agents.items():
-            if agent.status != "working" or not agent.current_task:
-                continue
-                
-            task_id = agent.current_task["id"]
-            task_progress = self.memory_client.get_world_state(f"task_progress:{task_id}")
+        """Monitor progress of running tasks.
+        
+        Progress is normally delivered through ``_handle_progress``; this
+        sweep only catches reports and status changes that bypassed it.
+        """
+        self.drain_progress_events()
+        self._refresh_agent_index()
+        
+        get_world_state = self.memory_client.get_world_state
+        
+        # Agents clear their current task when they finish, so look up the
+        # outstanding assignments rather than each agent's current task
+        for task_id in list(self._assignments.values()):
+            task_progress = get_world_state(f"task_progress:{task_id}")
             
             if not task_progress:
                 continue
                 
-            if task_progress.get("status") == "completed":
+            status = task_progress.get("status")
+            if status == "completed":
                 # Task completed successfully
                 self.handle_completed_task(task_id, task_progress)
                 
-            elif task_progress.get("status") == "failed":
+            elif status == "failed":
                 # Task failed
                 self.handle_failed_task(task_id, task_progress)
                 
+        self._flush_writes()
+        
     def handle_completed_task(self, task_id: str, result: Dict[str, Any]) -> None:
         """Handle a successfully completed task.
         
+        The long-term record is written with the next batch of memory writes.
+        
         Args:
             task_id: ID of the completed task
             result: Task result data
         """
-        # Update task in queue
+        # Update task in queue, which holds the authoritative copy
         self.task_queue.update_task(task_id, {
             "status": "completed",
-            "result": result
+            "result": result,
+            "completed_at": time.time()
         })
         
-        # Update in long-term memory
-        task_data = self.memory_client.get_long_term(f"task:{task_id}")
-        if task_data:
-            task_data["status"] = "completed"
-            task_data["result"] = result
-            task_data["completed_at"] = datetime.now().isoformat()
-            self.memory_client.store_long_term(f"task:{task_id}", task_data)
+        # Update in long-term memory without reading the old record back
+        task = self.task_queue.get_task(task_id)
+        if task is not None:
+            self._release_assignment(task)
+            self._pending_writes.append(("store_long_term", f"task:{task_id}", task.to_dict()))
             
         self.logger.info(f"Task {task_id} completed successfully")
         
     def handle_failed_task(self, task_id: str, error_data: Dict[str, Any]) -> None:
         """Handle a failed task.
         
+        The long-term record is written with the next batch of memory writes.
+        
         Args:
             task_id: ID of the failed task
             error_data: Error information
         """
-        # Update task in queue
+        # Update task in queue, which holds the authoritative copy
         self.task_queue.update_task(task_id, {
             "status": "failed",
-            "result": error_data
+            "result": error_data,
+            "failed_at": time.time()
         })
         
-        # Update in long-term memory
-        task_data = self.memory_client.get_long_term(f"task:{task_id}")
-        if task_data:
-            task_data["status"] = "failed"
-            task_data["result"] = error_data
-            task_data["failed_at"] = datetime.now().isoformat()
-            self.memory_client.store_long_term(f"task:{task_id}", task_data)
+        # Update in long-term memory without reading the old record back
+        task = self.task_queue.get_task(task_id)
+        if task is not None:
+            self._release_assignment(task)
+            self._pending_writes.append(("store_long_term", f"task:{task_id}", task.to_dict()))
             
         self.logger.error(f"Task {task_id} failed: {error_data.get('message', 'Unknown error')}")
         
-    async def run(self, interval: float = 5.0) -> None:
+    def _release_assignment(self, task: Task) -> None:
+        """Forget the assignment of a finished task to its agent.
+        
+        Args:
+            task: Task that completed or failed
+        """
+        if self._assignments.get(task.assigned_to) == task.id:
+            del self._assignments[task.assigned_to]
+            
+    async def run(self, interval: float = 5.0, sweep_every: int = 10) -> None:
         """Run the orchestrator in a continuous loop.
         
+        Running under uvloop (``asyncio.Runner(loop_factory=uvloop.new_event_loop)``,
+        as ``main.run()`` does) is recommended; it lowers the per-await overhead
+        of each cycle.
+        
+        A cycle starts as soon as ``wake_event`` is set, which happens when a
+        task is created, an agent is registered or an agent reports progress,
+        including through the progress queue from a worker thread; otherwise
+        the loop wakes every ``interval`` seconds.
+        
         Args:
-            interval: Time between orchestration cycles in seconds
+            interval: Maximum time between orchestration cycles in seconds
+            sweep_every: Number of cycles between safety sweeps of task progress
         """
         self.logger.info("Starting orchestrator")
+        cycle = 0
         
-        while True:
-            try:
-                # Assign available tasks
-                assigned = await self.assign_tasks()
-                if assigned > 0:
-                    self.logger.info(f"Assigned {assigned} tasks")
-                
-                # Monitor task progress
-                await self.monitor_progress()
-                
-                # Update world state
-                self.update_system_state()
-                
-                # Wait before next cycle
-                await asyncio.sleep(interval)
-                
-            except Exception as e:
-                self.logger.error(f"Error in orchestrator cycle: {str(e)}")
-                await asyncio.sleep(interval)
+        # Agents on worker threads can't set the asyncio event themselves, so
+        # their puts schedule it on this loop
+        self.progress_events.waker = functools.partial(
+            asyncio.get_running_loop().call_soon_threadsafe, self.wake_event.set
+        )
+        
+        try:
+            while True:
+                try:
+                    # Pick up progress queued by agents on worker threads
+                    self.drain_progress_events()
+                    
+                    # Assign available tasks
+                    assigned = await self.assign_tasks()
+                    if assigned > 0:
+                        self.logger.info(f"Assigned {assigned} tasks")
+                    
+                    # Progress arrives through agent callbacks; sweep occasionally
+                    cycle += 1
+                    if cycle % sweep_every == 0:
+                        await self.monitor_progress()
+                    
+                    # Update world state
+                    self.update_system_state()
+                    
+                    # Wait for new work, or until the next periodic cycle
+                    await self._wait_for_work(interval)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error in orchestrator cycle: {str(e)}")
+                    await asyncio.sleep(interval)
+        finally:
+            self.progress_events.waker = None
+            
+    async def _wait_for_work(self, timeout: float) -> None:
+        """Wait until new work is signalled or the timeout expires.
+        
+        The timeout sets the event itself rather than going through
+        ``asyncio.wait_for``, which on Python 3.11 can swallow a cancellation
+        that arrives just as the event is set.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+        """
+        deadline = asyncio.get_running_loop().call_later(timeout, self.wake_event.set)
+        try:
+            await self.wake_event.wait()
+        finally:
+            deadline.cancel()
+        self.wake_event.clear()
                 
     def update_system_state(self) -> None:
         """Update the overall system state in world state."""
-        # Count tasks by status
-        task_counts = {
-            "pending": 0,
-            "assigned": 0,
-            "completed": 0,
-            "failed": 0
-        }
-        
-        for task in self.task_queue.tasks.values():
-            if task.status in task_counts:
-                task_counts[task.status] += 1
-                
-        # Count agents by status
-        agent_counts = {
-            "idle": 0,
-            "working": 0
-        }
+        # Read the running status counters instead of walking every task
+        task_counts = self.task_queue.status_counts
+        agent_counts = self.agent_status_counts
         
-        for agent in self.agents.values():
-            if agent.status in agent_counts:
-                agent_counts[agent.status] += 1
-                
         # Update world state
-        self.memory_client.update_world_state("system:status", {
-            "tasks": task_counts,
-            "agents": agent_counts,
-            "updated_at": datetime.now().isoformat()
-        })
+        self._pending_writes.append(("update_world_state", "system:status", {
+            "tasks": {
+                status: task_counts.get(status, 0)
+                for status in ("pending", "assigned", "completed", "failed")
+            },
+            "agents": {
+                status: agent_counts.get(status, 0)
+                for status in ("idle", "working")
+            },
+            "updated_at": now_iso()
+        }))
+        self._flush_writes()
+        
+    def _flush_writes(self) -> None:
+        """Send all deferred memory writes in one batch."""
+        if not self._pending_writes:
+            return
+            
+        items = self._pending_writes
+        self._pending_writes = []
+        
+        batch = getattr(self.memory_client, "batch", None)
+        if batch is not None:
+            batch(items)
+        else:
+            for op, key, value in items:
+                getattr(self.memory_client, op)(key, value)
@@ -1,6 +1,12 @@
-import uuid
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import heapq
+import itertools
+import time
+from typing import Dict, List, Any, Iterator, Optional, Tuple, Union
+
+from .utils import RUN_ID, format_timestamp, json_dumps, json_loads, parse_timestamp
+
+# Source of task IDs; cheaper than a uuid4 (and its urandom call) per task
+_task_counter = itertools.count()
 
 class Task:
     """Represents a discrete unit of work in the system.
@@ -9,6 +15,25 @@ class Task:
     in the automated development system.
     """
     
+    __slots__ = (
+        "id",
+        "description",
+        "requirements",
+        "required_capabilities",
+        "required_capabilities_set",
+        "priority",
+        "dependencies",
+        "context",
+        "status",
+        "created_at",
+        "assigned_to",
+        "result",
+        "completed_at",
+        "failed_at",
+        "unmet_deps",
+        "_dict_cache",
+    )
+    
     def __init__(
         self,
         description: str,
@@ -28,25 +53,39 @@ class Task:
             dependencies: List of task IDs that must be completed first
             context: Additional context information for the task
         """
-        self.id = str(uuid.uuid4())
+        self.id = f"{RUN_ID}-t{next(_task_counter):x}"
         self.description = description
         self.requirements = requirements
         self.required_capabilities = required_capabilities or []
+        self.required_capabilities_set = frozenset(self.required_capabilities)
         self.priority = priority
         self.dependencies = dependencies or []
         self.context = context or {}
         self.status = "pending"
-        self.created_at = datetime.now().isoformat()
+        self.created_at = time.time()
         self.assigned_to = None
         self.result = None
+        self.completed_at: Optional[float] = None
+        self.failed_at: Optional[float] = None
+        self.unmet_deps = len(self.dependencies)
+        self._dict_cache: Optional[Dict[str, Any]] = None
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert task to dictionary for storage.
         
+        The dictionary is built once and cached until the task is next changed
+        through ``TaskQueue.update_task``. Each call returns a shallow copy of
+        the cache, so callers (agents, memory clients) can change top-level
+        fields safely; nested lists and dicts are still shared with the task
+        and must not be mutated.
+        
         Returns:
             Dictionary representation of the task
         """
-        return {
+        if self._dict_cache is not None:
+            return dict(self._dict_cache)
+            
+        self._dict_cache = {
             "id": self.id,
             "description": self.description,
             "requirements": self.requirements,
@@ -55,10 +94,15 @@ class Task:
             "dependencies": self.dependencies,
             "context": self.context,
             "status": self.status,
-            "created_at": self.created_at,
+            "created_at": format_timestamp(self.created_at),
             "assigned_to": self.assigned_to,
             "result": self.result
         }
+        if self.completed_at is not None:
+            self._dict_cache["completed_at"] = format_timestamp(self.completed_at)
+        if self.failed_at is not None:
+            self._dict_cache["failed_at"] = format_timestamp(self.failed_at)
+        return dict(self._dict_cache)
         
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Task':
@@ -82,19 +126,69 @@ class Task:
         # Override auto-generated fields
         task.id = data["id"]
         task.status = data["status"]
-        task.created_at = data["created_at"]
+        task.created_at = parse_timestamp(data["created_at"])
         task.assigned_to = data.get("assigned_to")
         task.result = data.get("result")
+        if data.get("completed_at") is not None:
+            task.completed_at = parse_timestamp(data["completed_at"])
+        if data.get("failed_at") is not None:
+            task.failed_at = parse_timestamp(data["failed_at"])
         
         return task
+        
+    def to_json(self) -> bytes:
+        """Serialize the task for memory clients that store raw JSON.
+        
+        Returns:
+            UTF-8 encoded JSON of ``to_dict()``
+        """
+        return json_dumps(self.to_dict())
+        
+    @classmethod
+    def from_json(cls, data: Union[bytes, str]) -> 'Task':
+        """Create a task from JSON produced by ``to_json``.
+        
+        Args:
+            data: JSON document as bytes or text
+            
+        Returns:
+            Task instance
+        """
+        return cls.from_dict(json_loads(data))
 
 
 class TaskQueue:
-    """Manages a collection of tasks with prioritization and dependency tracking."""
+    """Manages a collection of tasks with prioritization and dependency tracking.
+    
+    Pending tasks whose dependencies are satisfied are kept in a max-heap keyed
+    by (-priority, created_at, seq) so the highest priority task can be found
+    without scanning and sorting the whole queue. ``seq`` is the order in which
+    tasks were added, so tasks with equal priority and timestamp stay first in,
+    first out. ``_heap_entries`` maps each
+    ready task to its current heap entry; entries for tasks that leave the
+    pending state are deleted lazily, by dropping them from that map and
+    skipping them when they surface at the top of the heap.
+    
+    Each task carries a wait counter (``unmet_deps``) and ``_unlocks`` maps a
+    task ID to the tasks waiting on it. Completing a task decrements the
+    counters of the tasks it unlocks, and a task enters the heap once its
+    counter reaches zero.
+    
+    Completed and failed tasks are moved from ``tasks`` into ``archive`` so
+    the live set only holds work that is still in flight. Use ``get_task``
+    to look a task up in either.
+    """
     
     def __init__(self):
         """Initialize a new task queue."""
         self.tasks: Dict[str, Task] = {}
+        self.archive: Dict[str, Task] = {}
+        self._pending_heap: List[Tuple[int, float, int, str]] = []
+        self._heap_entries: Dict[str, Tuple[int, float, int, str]] = {}
+        self._sequence = itertools.count()
+        self._seq: Dict[str, int] = {}
+        self._unlocks: Dict[str, List[str]] = {}
+        self.status_counts: Dict[str, int] = {}
         
     def add_task(self, task: Task) -> str:
         """Add a task to the queue.
@@ -106,8 +200,36 @@ class TaskQueue:
             Task ID
         """
         self.tasks[task.id] = task
+        self._seq.setdefault(task.id, next(self._sequence))
+        self.status_counts[task.status] = self.status_counts.get(task.status, 0) + 1
+        
+        unmet = 0
+        for dep in task.dependencies:
+            dep_task = self.get_task(dep)
+            if dep_task is not None and dep_task.status == "completed":
+                continue
+            self._unlocks.setdefault(dep, []).append(task.id)
+            unmet += 1
+        task.unmet_deps = unmet
+        
+        if task.status == "pending" and not unmet:
+            self._push_pending(task)
         return task.id
         
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Get a live or archived task by ID.
+        
+        Args:
+            task_id: ID of the task
+            
+        Returns:
+            The task, or None if it is not known
+        """
+        task = self.tasks.get(task_id)
+        if task is None:
+            task = self.archive.get(task_id)
+        return task
+        
     def get_next_task(self, agent_capabilities: List[str]) -> Optional[Task]:
         """Get the next appropriate task for an agent with given capabilities.
         
@@ -117,30 +239,51 @@ class TaskQueue:
         Returns:
             Next suitable task or None if no suitable task exists
         """
-        available_tasks = []
+        capabilities = frozenset(agent_capabilities)
         
-        for task in self.tasks.values():
-            # Skip tasks that aren't pending
-            if task.status != "pending":
-                continue
-                
-            # Skip tasks with unmet dependencies
-            if any(self.tasks.get(dep, Task("", [])).status != "completed" 
-                   for dep in task.dependencies):
-                continue
-                
-            # Skip tasks requiring capabilities the agent doesn't have
-            if not all(cap in agent_capabilities for cap in task.required_capabilities):
-                continue
-                
-            available_tasks.append(task)
-            
-        if not available_tasks:
+        ready = self.ready_tasks()
+        try:
+            for task in ready:
+                # Skip tasks requiring capabilities the agent doesn't have
+                if task.required_capabilities_set <= capabilities:
+                    return task
             return None
+        finally:
+            ready.close()
             
-        # Return highest priority task
-        return sorted(available_tasks, key=lambda t: t.priority, reverse=True)[0]
+    def ready_tasks(self) -> Iterator[Task]:
+        """Iterate over ready tasks in priority order.
+        
+        Tasks stay queued until their status changes, so every entry popped
+        while iterating is restored when the iteration ends. Tasks whose status
+        changed in the meantime are dropped instead.
         
+        Yields:
+            Pending tasks whose dependencies are satisfied
+        """
+        heap = self._pending_heap
+        popped = []
+        
+        try:
+            while heap:
+                entry = heapq.heappop(heap)
+                task_id = entry[3]
+                
+                # Drop entries that have been removed or superseded
+                if self._heap_entries.get(task_id) is not entry:
+                    continue
+                    
+                task = self.tasks.get(task_id)
+                if task is None or task.status != "pending":
+                    continue
+                    
+                popped.append(entry)
+                yield task
+        finally:
+            for entry in popped:
+                if self._heap_entries.get(entry[3]) is entry:
+                    heapq.heappush(heap, entry)
+                
     def update_task(self, task_id: str, updates: Dict[str, Any]) -> bool:
         """Update an existing task.
         
@@ -151,11 +294,66 @@ class TaskQueue:
         Returns:
             True if update was successful, False otherwise
         """
-        if task_id not in self.tasks:
+        task = self.get_task(task_id)
+        if task is None:
             return False
             
+        old_status = task.status
+        
         for key, value in updates.items():
-            if hasattr(self.tasks[task_id], key):
-                setattr(self.tasks[task_id], key, value)
+            if hasattr(task, key):
+                setattr(task, key, value)
+        if "required_capabilities" in updates:
+            task.required_capabilities_set = frozenset(task.required_capabilities)
+        task._dict_cache = None
+        
+        if task.id in self._heap_entries and ("priority" in updates or "created_at" in updates):
+            # Re-key the heap entry; the old one is now stale and skipped
+            self._push_pending(task)
+            
+        if task.status != old_status:
+            self.status_counts[old_status] -= 1
+            self.status_counts[task.status] = self.status_counts.get(task.status, 0) + 1
+            
+            if old_status == "pending":
+                self._remove_pending(task)
+            elif task.status == "pending" and not task.unmet_deps:
+                self._push_pending(task)
+                
+            if task.status == "completed":
+                self._release_dependents(task_id)
+                
+            # Keep only in-flight tasks in the live set
+            if task.status in ("completed", "failed"):
+                self.archive[task_id] = self.tasks.pop(task_id, task)
+            elif task_id in self.archive:
+                self.tasks[task_id] = self.archive.pop(task_id)
                 
         return True
+        
+    def _release_dependents(self, task_id: str) -> None:
+        """Decrement the wait counters of the tasks unlocked by a completed task.
+        
+        Args:
+            task_id: ID of the completed task
+        """
+        for dependent_id in self._unlocks.pop(task_id, ()):
+            # Archived dependents still count down so they run if retried
+            dependent = self.get_task(dependent_id)
+            if dependent is None:
+                continue
+            dependent.unmet_deps -= 1
+            if dependent.unmet_deps == 0 and dependent.status == "pending":
+                self._push_pending(dependent)
+                
+    def _push_pending(self, task: Task) -> None:
+        """Add a ready task to the heap."""
+        # Entries are matched by identity, so a stale entry with the same
+        # key is never mistaken for the current one
+        entry = (-task.priority, task.created_at, self._seq[task.id], task.id)
+        self._heap_entries[task.id] = entry
+        heapq.heappush(self._pending_heap, entry)
+            
+    def _remove_pending(self, task: Task) -> None:
+        """Lazily remove a task that has left the pending state."""
+        self._heap_entries.pop(task.id, None)
@@ -0,0 +1,73 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # optional: pip install automated-dev-agents[fast]
+    orjson = None
+
+# Random prefix captured once per process, so IDs built from per-process
+# counters stay unique across processes sharing the same memory system
+RUN_ID = uuid.uuid4().hex[:8]
+
+def now_iso() -> str:
+    """Get the current local time as an ISO 8601 string.
+    
+    Returns:
+        Current time in ISO 8601 format
+    """
+    return datetime.now().isoformat()
+
+def format_timestamp(timestamp: float) -> str:
+    """Format a ``time.time()`` timestamp as an ISO 8601 string.
+    
+    Args:
+        timestamp: Seconds since the epoch
+        
+    Returns:
+        Timestamp in ISO 8601 format
+    """
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+def parse_timestamp(value: Union[str, float]) -> float:
+    """Convert a stored timestamp back to seconds since the epoch.
+    
+    Args:
+        value: ISO 8601 string or seconds since the epoch
+        
+    Returns:
+        Seconds since the epoch
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).timestamp()
+    return float(value)
+
+def json_dumps(value: Any) -> bytes:
+    """Serialize a value to JSON bytes, using orjson when it is installed.
+    
+    Values JSON can't represent are stored as their string form.
+    
+    Args:
+        value: Value to serialize
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, default=str, separators=(",", ":")).encode()
+
+def json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON produced by ``json_dumps`` (or any other JSON source).
+    
+    Args:
+        data: JSON document as bytes or text
+        
+    Returns:
+        Parsed value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
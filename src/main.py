@@ -10,29 +10,173 @@ Usage:
     python main.py [--config CONFIG_PATH] [--verbose]
 """
 
+from __future__ import annotations
+
 import os
 import sys
+import atexit
 import logging
-import argparse
+import logging.handlers
+import queue
 import asyncio
-import json
-from typing import Dict, List, Any, Optional
+import heapq
+import importlib
+import itertools
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+from core.utils import json_loads
 
-from core.agent import Agent
-from core.orchestrator import TaskOrchestrator
+if TYPE_CHECKING:
+    # Only needed for annotations; the modules are imported where they're used
+    from collections.abc import Callable, Iterable, Iterator
+    from typing import Any
+    
+    from core.agent import Agent
+    from core.orchestrator import TaskOrchestrator
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
+def configure_logging() -> None:
+    """Configure logging to write through a background thread.
+    
+    Records are formatted by the caller and put on a queue; a listener
+    thread writes them to the console and the log file, so logging calls
+    never wait on I/O. The log file is only opened once the first record is
+    written.
+    """
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
         logging.StreamHandler(),
-        logging.FileHandler('automated_dev_agents.log')
-    ]
-)
+        logging.FileHandler('automated_dev_agents.log', delay=True)
+    )
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
 logger = logging.getLogger("main")
 
+class _Entry:
+    """A value stored by the mock MTMA client.
+    
+    Searchable values (dicts and strings) also keep their lowercased text
+    and the form a search returns them in, both built when the value is
+    stored, so searches don't have to rebuild either.
+    """
+    
+    __slots__ = ("value", "text", "result")
+    
+    # Joins dict values, so only a query containing it can match across values
+    SEPARATOR = "\x00"
+    
+    def __init__(self, key: str, value: Any):
+        """Initialize an entry.
+        
+        Args:
+            key: Key the value is stored under
+            value: Stored value
+        """
+        self.value = value
+        if isinstance(value, dict):
+            # Lowercase the joined text once rather than each value separately
+            self.text = self.SEPARATOR.join(map(str, value.values())).lower() if value else None
+            self.result = value
+        elif isinstance(value, str):
+            self.text = value.lower()
+            self.result = {"key": key, "content": value}
+        else:
+            self.text = None
+            self.result = None
+
+class _TextIndex:
+    """Trigram index over the text of stored entries.
+    
+    Maps each three-character sequence to the keys whose text contains it,
+    so a search only verifies keys that contain every trigram of the query
+    instead of re-reading every stored value.
+    """
+    
+    def __init__(self):
+        """Initialize an empty index."""
+        self._keys_by_trigram: dict[str, set[str]] = defaultdict(set)
+        self._order: dict[str, int] = {}  # key -> position in its store
+        self._counter = itertools.count()
+        
+    @staticmethod
+    def _trigrams(text: str) -> set[str]:
+        """Get the distinct three-character substrings of a string."""
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+        
+    def add(self, key: str, entry: _Entry, previous: _Entry | None = None) -> None:
+        """Index an entry, replacing the one previously stored under the key.
+        
+        Args:
+            key: Key the entry is stored under
+            entry: Stored entry
+            previous: Entry the new one replaces, if any
+        """
+        if previous is not None:
+            self.discard(key, previous)
+        elif key not in self._order:
+            self._order[key] = next(self._counter)
+            
+        if entry.text is not None:
+            for trigram in self._trigrams(entry.text):
+                self._keys_by_trigram[trigram].add(key)
+                
+    def discard(self, key: str, entry: _Entry) -> None:
+        """Remove an entry's text from the index.
+        
+        Args:
+            key: Key the entry is stored under
+            entry: Entry to remove
+        """
+        if entry.text is None:
+            return
+        for trigram in self._trigrams(entry.text):
+            keys = self._keys_by_trigram[trigram]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_trigram[trigram]
+                
+    def remove(self, key: str, entry: _Entry) -> None:
+        """Forget a key that was deleted from its store.
+        
+        Args:
+            key: Deleted key
+            entry: Entry that was stored under the key
+        """
+        self.discard(key, entry)
+        self._order.pop(key, None)
+        
+    def candidates(self, query: str) -> list[str] | None:
+        """Find keys whose text contains every trigram of a query.
+        
+        Args:
+            query: Lowercased search query
+            
+        Returns:
+            Candidate keys in the order they were first stored, or None if
+            the query is too short to use the index
+        """
+        trigrams = self._trigrams(query)
+        if not trigrams:
+            return None
+            
+        groups = []
+        for trigram in trigrams:
+            keys = self._keys_by_trigram.get(trigram)
+            if not keys:
+                return []
+            groups.append(keys)
+            
+        groups.sort(key=len)
+        return sorted(groups[0].intersection(*groups[1:]), key=self._order.__getitem__)
+
 class MockMTMAClient:
     """Mock implementation of MTMA client for development purposes.
     
@@ -42,9 +186,17 @@ class MockMTMAClient:
     
     def __init__(self):
         """Initialize the mock MTMA client."""
-        self.short_term = {}
-        self.long_term = {}
+        self.short_term: dict[str, _Entry] = {}
+        self.long_term: dict[str, _Entry] = {}
         self.world_state = {}
+        self._short_index = _TextIndex()
+        self._long_index = _TextIndex()
+        
+        # Short-term expiry times, with a heap of (expires_at, key) so expired
+        # entries are found without scanning; superseded heap entries are
+        # skipped when they surface
+        self._short_expiry: dict[str, float] = {}
+        self._expiry_heap: list[tuple[float, str]] = []
         self.logger = logging.getLogger("mock_mtma")
         
     def store_short_term(self, key: str, value: Any, ttl: int = 3600, lock: bool = False) -> None:
@@ -53,13 +205,24 @@ class MockMTMAClient:
         Args:
             key: Key to store the value under
             value: Value to store
-            ttl: Time-to-live in seconds (ignored in mock)
+            ttl: Time-to-live in seconds
             lock: Whether to lock the value (ignored in mock)
         """
-        self.short_term[key] = value
-        self.logger.debug(f"Stored in short-term: {key}")
+        key = sys.intern(key)
+        entry = _Entry(key, value)
+        self._short_index.add(key, entry, self.short_term.get(key))
+        self.short_term[key] = entry
+        
+        expires_at = time.monotonic() + ttl
+        self._short_expiry[key] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        if len(self._expiry_heap) > 2 * len(self._short_expiry) + 64:
+            # Mostly superseded entries; rebuild from the current expiry times
+            self._expiry_heap = [(t, k) for k, t in self._short_expiry.items()]
+            heapq.heapify(self._expiry_heap)
+        self.logger.debug("Stored in short-term: %s", key)
         
-    def get_short_term(self, key: str) -> Optional[Any]:
+    def get_short_term(self, key: str) -> Any | None:
         """Get a value from short-term memory.
         
         Args:
@@ -68,8 +231,20 @@ class MockMTMAClient:
         Returns:
             Stored value or None if not found
         """
-        return self.short_term.get(key)
+        self._expire_short_term()
+        entry = self.short_term.get(key)
+        return entry.value if entry is not None else None
         
+    def _expire_short_term(self) -> None:
+        """Delete short-term values whose time-to-live has passed."""
+        heap = self._expiry_heap
+        now = time.monotonic()
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            if self._short_expiry.get(key) == expires_at:
+                del self._short_expiry[key]
+                self._short_index.remove(key, self.short_term.pop(key))
+                
     def store_long_term(self, key: str, value: Any) -> None:
         """Store a value in long-term memory.
         
@@ -77,10 +252,13 @@ class MockMTMAClient:
             key: Key to store the value under
             value: Value to store
         """
-        self.long_term[key] = value
-        self.logger.debug(f"Stored in long-term: {key}")
+        key = sys.intern(key)
+        entry = _Entry(key, value)
+        self._long_index.add(key, entry, self.long_term.get(key))
+        self.long_term[key] = entry
+        self.logger.debug("Stored in long-term: %s", key)
         
-    def get_long_term(self, key: str) -> Optional[Any]:
+    def get_long_term(self, key: str) -> Any | None:
         """Get a value from long-term memory.
         
         Args:
@@ -89,7 +267,8 @@ class MockMTMAClient:
         Returns:
             Stored value or None if not found
         """
-        return self.long_term.get(key)
+        entry = self.long_term.get(key)
+        return entry.value if entry is not None else None
         
     def update_world_state(self, key: str, value: Any) -> None:
         """Update a value in world state.
@@ -98,10 +277,10 @@ class MockMTMAClient:
             key: Key to update
             value: New value
         """
-        self.world_state[key] = value
-        self.logger.debug(f"Updated world state: {key}")
+        self.world_state[sys.intern(key)] = value
+        self.logger.debug("Updated world state: %s", key)
         
-    def get_world_state(self, key: str) -> Optional[Any]:
+    def get_world_state(self, key: str) -> Any | None:
         """Get a value from world state.
         
         Args:
@@ -112,7 +291,17 @@ class MockMTMAClient:
         """
         return self.world_state.get(key)
         
-    def search_short_term(self, query: str, limit: int = 10) -> List[Any]:
+    def batch(self, items: list[tuple[str, str, Any]]) -> None:
+        """Apply several writes in a single call.
+        
+        Args:
+            items: Writes as (op, key, value) tuples, where op names a
+                write method such as "store_long_term"
+        """
+        for op, key, value in items:
+            getattr(self, op)(key, value)
+        
+    def search_short_term(self, query: str, limit: int = 10) -> list[Any]:
         """Search in short-term memory.
         
         Args:
@@ -122,20 +311,10 @@ class MockMTMAClient:
         Returns:
             List of matching values
         """
-        # Very simplistic search implementation
-        results = []
-        for key, value in self.short_term.items():
-            if isinstance(value, dict) and any(query.lower() in str(v).lower() for v in value.values()):
-                results.append(value)
-            elif isinstance(value, str) and query.lower() in value.lower():
-                results.append({"key": key, "content": value})
-                
-            if len(results) >= limit:
-                break
-                
-        return results
+        self._expire_short_term()
+        return self._search(self.short_term, self._short_index, query, limit)
         
-    def search_long_term(self, query: str, limit: int = 10) -> List[Any]:
+    def search_long_term(self, query: str, limit: int = 10) -> list[Any]:
         """Search in long-term memory.
         
         Args:
@@ -145,18 +324,72 @@ class MockMTMAClient:
         Returns:
             List of matching values
         """
-        # Similar simplistic search implementation
-        results = []
-        for key, value in self.long_term.items():
-            if isinstance(value, dict) and any(query.lower() in str(v).lower() for v in value.values()):
-                results.append(value)
-            elif isinstance(value, str) and query.lower() in value.lower():
-                results.append({"key": key, "content": value})
-                
-            if len(results) >= limit:
-                break
-                
-        return results
+        return self._search(self.long_term, self._long_index, query, limit)
+        
+    def _search(self, store: dict[str, _Entry], index: _TextIndex, query: str, limit: int) -> list[Any]:
+        """Search a store for values whose text contains the query.
+        
+        Args:
+            store: Store to search
+            index: Text index of the store
+            query: Search query
+            limit: Maximum number of results
+            
+        Returns:
+            List of matching values
+        """
+        query = query.lower()
+        keys: Iterable[str] | None = index.candidates(query)
+        if keys is None:
+            # Queries shorter than a trigram fall back to a simplistic scan
+            keys = store.keys()
+            
+        return list(itertools.islice(self._iter_matches(store, keys, query), max(limit, 0)))
+        
+    @staticmethod
+    def _iter_matches(store: dict[str, _Entry], keys: Iterable[str], query: str) -> Iterator[Any]:
+        """Yield search results for the given keys whose text contains the query.
+        
+        Args:
+            store: Store being searched
+            keys: Keys to check, in result order
+            query: Lowercased search query
+            
+        Yields:
+            Matching values; strings are wrapped with the key they're stored under
+        """
+        # Match against the text cached at store time, lowercased once
+        for key in keys:
+            entry = store[key]
+            if entry.text is not None and query in entry.text:
+                yield entry.result
+
+# Canned MockLLMClient responses, chosen by what the prompt mentions
+
+_CODE_RESPONSE = "```python\ndef example_function(x, y):\n    \"\"\"Example function that adds two numbers.\"\"\"\n    return x + y\n```\n\nThis implementation provides a simple function that adds two numbers together. It demonstrates proper documentation with a docstring and clear parameter naming."
+
+_TEST_RESPONSE = "```python\nimport unittest\n\nclass TestExampleFunction(unittest.TestCase):\n    def test_positive_numbers(self):\n        self.assertEqual(example_function(2, 3), 5)\n    \n    def test_negative_numbers(self):\n        self.assertEqual(example_function(-1, -2), -3)\n    \n    def test_mixed_numbers(self):\n        self.assertEqual(example_function(-5, 10), 5)\n```\n\nThese tests cover the basic functionality of the example_function for positive, negative, and mixed number inputs."
+
+_DEFAULT_RESPONSE = "This is a placeholder response from the mock LLM client. In a real implementation, this would be a detailed and helpful response based on the prompt provided."
+
+def _select_response(prompt: str) -> str:
+    """Choose the canned response for a prompt.
+    
+    Args:
+        prompt: Prompt string
+        
+    Returns:
+        Response for prompts about code, then tests, or the default response
+    """
+    # One lowercased copy serves both checks; substring search on it is
+    # several times faster than case-insensitive regex matching
+    lowered = prompt.lower()
+    if "code" in lowered:
+        return _CODE_RESPONSE
+    elif "test" in lowered:
+        return _TEST_RESPONSE
+    else:
+        return _DEFAULT_RESPONSE
 
 class MockLLMClient:
     """Mock implementation of LLM client for development purposes.
@@ -178,19 +411,86 @@ class MockLLMClient:
         Returns:
             Generated response string
         """
-        self.logger.info(f"Received prompt ({len(prompt)} chars)")
+        self.logger.info("Received prompt (%d chars)", len(prompt))
         
-        # Return a simple mock response
-        if "code" in prompt.lower():
-            return "```python\ndef example_function(x, y):\n    \"\"\"Example function that adds two numbers.\"\"\"\n    return x + y\n```\n\nThis implementation provides a simple function that adds two numbers together. It demonstrates proper documentation with a docstring and clear parameter naming."
-        elif "test" in prompt.lower():
-            return "```python\nimport unittest\n\nclass TestExampleFunction(unittest.TestCase):\n    def test_positive_numbers(self):\n        self.assertEqual(example_function(2, 3), 5)\n    \n    def test_negative_numbers(self):\n        self.assertEqual(example_function(-1, -2), -3)\n    \n    def test_mixed_numbers(self):\n        self.assertEqual(example_function(-5, 10), 5)\n```\n\nThese tests cover the basic functionality of the example_function for positive, negative, and mixed number inputs."
-        else:
-            return "This is a placeholder response from the mock LLM client. In a real implementation, this would be a detailed and helpful response based on the prompt provided."
+        # Return a simple mock response; nothing here needs to await
+        return _select_response(prompt)
+
+# Config files at least this large are streamed with ijson when it's installed
+STREAM_CONFIG_BYTES = 1_000_000
+
+def _is_large_config(config_path: str) -> bool:
+    """Check whether a config file is large enough to be streamed.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        True if the file should be streamed rather than loaded whole
+    """
+    try:
+        return os.path.getsize(config_path) >= STREAM_CONFIG_BYTES
+    except OSError:
+        return False
 
-def load_config(config_path: str) -> Dict[str, Any]:
+class _StreamedConfig(dict):
+    """Configuration loaded without its "agents" section.
+    
+    Remembers the file it was streamed from, so ``iter_agent_configs`` can
+    read the agent definitions from it one at a time.
+    """
+    
+    __slots__ = ("path",)
+    
+    def __init__(self, path: str):
+        """Initialize an empty streamed configuration.
+        
+        Args:
+            path: Path to the configuration file
+        """
+        super().__init__()
+        self.path = path
+
+def _load_settings_streaming(config_path: str) -> _StreamedConfig:
+    """Load the top-level settings of a config file, except its agents.
+    
+    The agent definitions are left in the file and read one at a time by
+    ``iter_agent_configs``.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Configuration dictionary without the "agents" section
+    """
+    import ijson
+    from ijson.common import ObjectBuilder
+    
+    config = _StreamedConfig(config_path)
+    key = None
+    builder = None
+    with open(config_path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "":
+                # A new top-level key (or the end of the file) ends the last value
+                if builder is not None:
+                    config[key] = builder.value
+                    builder = None
+                if event == "map_key":
+                    key = value
+                    if key != "agents":
+                        builder = ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+                
+    return config
+
+def load_config(config_path: str) -> dict[str, Any]:
     """Load configuration from file.
     
+    Large files are streamed when ijson is installed, leaving the agent
+    definitions to ``iter_agent_configs``.
+    
     Args:
         config_path: Path to the configuration file
         
@@ -198,19 +498,90 @@ def load_config(config_path: str) -> Dict[str, Any]:
         Configuration dictionary
     """
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = None
+        if _is_large_config(config_path):
+            try:
+                config = _load_settings_streaming(config_path)
+            except ImportError:
+                pass
+                
+        if config is None:
+            # Read raw bytes; orjson (when installed) parses them without decoding
+            with open(config_path, 'rb') as f:
+                config = json_loads(f.read())
         logger.info(f"Loaded configuration from {config_path}")
         return config
     except Exception as e:
         logger.error(f"Error loading configuration: {str(e)}")
         return {}
 
-def create_agents(config: Dict[str, Any], memory_client: Any, llm_client: Any) -> List[Agent]:
+def _llm_agent_kwargs(agent_config: dict[str, Any], memory_client: Any, llm_client: Any) -> dict[str, Any]:
+    """Build constructor arguments for agents that use the shared LLM client."""
+    return {
+        "name": agent_config["name"],
+        "memory_client": memory_client,
+        "llm_client": llm_client
+    }
+
+def _claude_agent_kwargs(agent_config: dict[str, Any], memory_client: Any, llm_client: Any) -> dict[str, Any]:
+    """Build constructor arguments for Claude integration agents."""
+    return {
+        "name": agent_config["name"],
+        "memory_client": memory_client,
+        "claude_api_key": agent_config.get("api_key", "dummy_key"),
+        "model": agent_config.get("model", "claude-3-7-sonnet")
+    }
+
+# Agent kinds by configuration key: (module, class name, description, kwargs builder).
+# Classes are imported only when the configuration lists agents of that kind.
+_AGENT_FACTORIES: dict[str, tuple[str, str, str, Callable[..., dict[str, Any]]]] = {
+    "code_generators": ("agents.code_generator", "CodeGeneratorAgent", "code generator", _llm_agent_kwargs),
+    "test_writers": ("agents.test_writer", "TestWriterAgent", "test writer", _llm_agent_kwargs),
+    "claude_integration": ("agents.claude_integration", "ClaudeIntegrationAgent", "Claude integration", _claude_agent_kwargs),
+}
+
+def iter_agent_configs(config: dict[str, Any]) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Iterate over the agent definitions in a configuration.
+    
+    Agents are produced kind by kind, in ``_AGENT_FACTORIES`` order. For a
+    large config file that ``load_config`` streamed, they are read from the
+    file so the whole list is never held in memory; a parse error there is
+    logged and ends the iteration, as it would have failed ``load_config``.
+    
+    Args:
+        config: Configuration dictionary returned by ``load_config``
+        
+    Yields:
+        (agent kind, agent configuration) pairs, where the kind is a key of
+        the "agents" section such as "code_generators"
+    """
+    if isinstance(config, _StreamedConfig):
+        import ijson
+        
+        try:
+            for key in _AGENT_FACTORIES:
+                with open(config.path, 'rb') as f:
+                    for agent_config in ijson.items(f, f"agents.{key}.item", use_float=True):
+                        yield key, agent_config
+        except Exception as e:
+            logger.error(f"Error loading agent configuration: {str(e)}")
+        return
+        
+    agent_configs = config.get("agents") or {}
+    for key in _AGENT_FACTORIES:
+        for agent_config in agent_configs.get(key) or ():
+            yield key, agent_config
+
+def create_agents(
+    agent_configs: Iterable[tuple[str, dict[str, Any]]],
+    memory_client: Any,
+    llm_client: Any,
+) -> list[Agent]:
     """Create agents based on configuration.
     
     Args:
-        config: Configuration dictionary
+        agent_configs: (agent kind, agent configuration) pairs, as produced
+            by ``iter_agent_configs``
         memory_client: MTMA client instance
         llm_client: LLM client instance
         
@@ -218,48 +589,60 @@ def create_agents(config: Dict[str, Any], memory_client: Any, llm_client: Any) -
         List of agent instances
     """
     agents = []
-    
-    # Import agent classes here to avoid circular imports
-    from agents.code_generator import CodeGeneratorAgent
-    from agents.test_writer import TestWriterAgent
-    from agents.claude_integration import ClaudeIntegrationAgent
+    agent_classes: dict[str, type] = {}
     
     # Create agents based on configuration
-    agent_configs = config.get("agents", {})
-    
-    # Create code generator agents
-    for agent_config in agent_configs.get("code_generators", []):
-        agent = CodeGeneratorAgent(
-            name=agent_config["name"],
-            memory_client=memory_client,
-            llm_client=llm_client
-        )
-        agents.append(agent)
-        logger.info(f"Created code generator agent: {agent.name}")
-        
-    # Create test writer agents
-    for agent_config in agent_configs.get("test_writers", []):
-        agent = TestWriterAgent(
-            name=agent_config["name"],
-            memory_client=memory_client,
-            llm_client=llm_client
-        )
-        agents.append(agent)
-        logger.info(f"Created test writer agent: {agent.name}")
-        
-    # Create Claude integration agents
-    for agent_config in agent_configs.get("claude_integration", []):
-        agent = ClaudeIntegrationAgent(
-            name=agent_config["name"],
-            memory_client=memory_client,
-            claude_api_key=agent_config.get("api_key", "dummy_key"),
-            model=agent_config.get("model", "claude-3-7-sonnet")
-        )
+    for key, agent_config in agent_configs:
+        module_name, class_name, kind, build_kwargs = _AGENT_FACTORIES[key]
+        agent_class = agent_classes.get(key)
+        if agent_class is None:
+            # Imported here to avoid circular imports, and only when needed
+            agent_class = getattr(importlib.import_module(module_name), class_name)
+            agent_classes[key] = agent_class
+            
+        agent = agent_class(**build_kwargs(agent_config, memory_client, llm_client))
         agents.append(agent)
-        logger.info(f"Created Claude integration agent: {agent.name}")
+        logger.info(f"Created {kind} agent: {agent.name}")
         
     return agents
 
+# Demonstration tasks; the test task is created depending on the code task.
+# Sequences are tuples so the tasks built from them can't alter the constants.
+DEMO_CODE_TASK: dict[str, Any] = {
+    "description": "Implement a function to calculate Fibonacci numbers",
+    "requirements": (
+        "The function should calculate the nth Fibonacci number",
+        "It should handle inputs up to n=100 efficiently",
+        "It should include proper error handling for invalid inputs",
+        "It should be well-documented with examples"
+    ),
+    "required_capabilities": ("code_generation",),
+    "priority": 2
+}
+
+DEMO_TEST_TASK: dict[str, Any] = {
+    "description": "Write tests for the Fibonacci function",
+    "requirements": (
+        "Test basic functionality with known Fibonacci numbers",
+        "Test error handling for invalid inputs",
+        "Test edge cases (0, 1, large numbers)",
+        "Ensure all tests are clear and well-documented"
+    ),
+    "required_capabilities": ("test_writing",),
+    "priority": 1
+}
+
+def _task_kwargs(spec: dict[str, Any]) -> dict[str, Any]:
+    """Build create_task arguments from a task constant, with fresh lists.
+    
+    Args:
+        spec: Task constant such as DEMO_CODE_TASK
+        
+    Returns:
+        Keyword arguments for TaskOrchestrator.create_task
+    """
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in spec.items()}
+
 async def setup_demo_tasks(orchestrator: TaskOrchestrator) -> None:
     """Set up demonstration tasks for testing.
     
@@ -267,48 +650,49 @@ async def setup_demo_tasks(orchestrator: TaskOrchestrator) -> None:
         orchestrator: Task orchestrator instance
     """
     # Create a simple task for code generation
-    code_task_id = orchestrator.create_task(
-        description="Implement a function to calculate Fibonacci numbers",
-        requirements=[
-            "The function should calculate the nth Fibonacci number",
-            "It should handle inputs up to n=100 efficiently",
-            "It should include proper error handling for invalid inputs",
-            "It should be well-documented with examples"
-        ],
-        required_capabilities=["code_generation"],
-        priority=2
-    )
+    code_task_id = orchestrator.create_task(**_task_kwargs(DEMO_CODE_TASK))
     
     # Create a task for writing tests for the code
-    test_task_id = orchestrator.create_task(
-        description="Write tests for the Fibonacci function",
-        requirements=[
-            "Test basic functionality with known Fibonacci numbers",
-            "Test error handling for invalid inputs",
-            "Test edge cases (0, 1, large numbers)",
-            "Ensure all tests are clear and well-documented"
-        ],
-        required_capabilities=["test_writing"],
-        dependencies=[code_task_id],
-        priority=1
-    )
+    test_task_id = orchestrator.create_task(**_task_kwargs(DEMO_TEST_TASK), dependencies=[code_task_id])
     
     logger.info(f"Created demo tasks: code_task_id={code_task_id}, test_task_id={test_task_id}")
 
+DEFAULT_CONFIG_PATH = "config/default.json"
+
+def parse_args(argv: list[str]) -> tuple[str, bool]:
+    """Parse command line arguments.
+    
+    Args:
+        argv: Arguments, not including the program name
+        
+    Returns:
+        Configuration file path and whether verbose logging is enabled
+    """
+    if not argv:
+        # Nothing to parse; skip building the argparse parser
+        return DEFAULT_CONFIG_PATH, False
+        
+    import argparse
+    parser = argparse.ArgumentParser(description="Automated Development System with Configurable Agents")
+    parser.add_argument("--config", default=DEFAULT_CONFIG_PATH, help="Path to configuration file")
+    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    args = parser.parse_args(argv)
+    return args.config, args.verbose
+
 async def main() -> None:
     """Main entry point for the system."""
     # Parse command line arguments
-    parser = argparse.ArgumentParser(description="Automated Development System with Configurable Agents")
-    parser.add_argument("--config", default="config/default.json", help="Path to configuration file")
-    parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
-    args = parser.parse_args()
+    config_path, verbose = parse_args(sys.argv[1:])
+    
+    # Configure logging once the arguments are known to be valid
+    configure_logging()
     
     # Set logging level based on verbosity
-    if args.verbose:
+    if verbose:
         logging.getLogger().setLevel(logging.DEBUG)
         
     # Load configuration
-    config = load_config(args.config)
+    config = load_config(config_path)
     
     # Initialize clients
     if config.get("use_mock_clients", True):
@@ -323,15 +707,17 @@ async def main() -> None:
         llm_client = MockLLMClient()
         
     # Initialize orchestrator
-    orchestrator = TaskOrchestrator(memory_client)
+    from core.orchestrator import TaskOrchestrator
+    # Shared wake-up event: setting it starts the next orchestration cycle
+    wake = asyncio.Event()
+    orchestrator = TaskOrchestrator(memory_client, wake_event=wake)
     
     # Create agents
-    agents = create_agents(config, memory_client, llm_client)
+    agents = create_agents(iter_agent_configs(config), memory_client, llm_client)
     
     # Register agents with orchestrator
-    for agent in agents:
-        orchestrator.register_agent(agent)
-        
+    orchestrator.register_agents(agents)
+    
     # Set up demo tasks if enabled
     if config.get("setup_demo_tasks", True):
         await setup_demo_tasks(orchestrator)
@@ -345,5 +731,23 @@ async def main() -> None:
     except Exception as e:
         logger.error(f"Error in main loop: {str(e)}")
         
+def run() -> None:
+    """Run the system, on uvloop's event loop when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+        
+    # Run outside the except block so errors aren't chained to the ImportError
+    if uvloop is None:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 11):
+        # Use uvloop for this run without installing a global loop policy
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        uvloop.install()
+        asyncio.run(main())
+        
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    run()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import threading
+import time
+from collections import deque
+
+from src.core.events import ProgressEvent, ProgressQueue
+
+
+def make_event(n=0):
+    return ProgressEvent(task_id=f"t{n}", agent_id="agent", status="working", reported_at="now")
+
+
+def test_put_reports_a_full_queue():
+    queue = ProgressQueue(capacity=2)
+    
+    assert queue.put(make_event(0))
+    assert queue.put(make_event(1))
+    assert not queue.put(make_event(2))
+    assert len(queue) == 2
+    
+    # Draining frees room again, and events come out in arrival order
+    assert [event.task_id for event in queue.consume_all()] == ["t0", "t1"]
+    assert queue.put(make_event(3))
+
+
+def test_unbounded_queue_accepts_everything():
+    queue = ProgressQueue(capacity=None)
+    for n in range(5000):
+        assert queue.put(make_event(n))
+    assert len(queue) == 5000
+
+
+class YieldingDeque(deque):
+    """Deque that gives up the GIL after a length check, widening any race."""
+    
+    def __len__(self):
+        length = super().__len__()
+        time.sleep(0.0001)
+        return length
+
+
+def test_capacity_holds_with_many_producers():
+    queue = ProgressQueue(capacity=100)
+    queue._items = YieldingDeque()
+    producers = 4
+    start = threading.Barrier(producers)
+    accepted = []
+    
+    def produce(worker):
+        start.wait()
+        count = 0
+        for n in range(50):
+            if queue.put(make_event(worker * 50 + n)):
+                count += 1
+        accepted.append(count)
+        
+    threads = [threading.Thread(target=produce, args=(worker,)) for worker in range(producers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+        
+    assert len(queue) == 100
+    assert sum(accepted) == 100
+    assert len(list(queue.consume_all())) == 100
+    assert len(queue) == 0
@@ -0,0 +1,202 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.core.agent import Agent
+from src.core.events import ProgressQueue
+from src.core.orchestrator import TaskOrchestrator
+
+
+class Memory:
+    """In-process memory client recording every write."""
+    
+    def __init__(self):
+        self.short_term = {}
+        self.long_term = {}
+        self.world_state = {}
+        self.batches = 0
+        
+    def store_short_term(self, key, value, ttl=3600, lock=False):
+        self.short_term[key] = value
+        
+    def get_short_term(self, key):
+        return self.short_term.get(key)
+        
+    def store_long_term(self, key, value):
+        self.long_term[key] = value
+        
+    def get_long_term(self, key):
+        return self.long_term.get(key)
+        
+    def update_world_state(self, key, value):
+        self.world_state[key] = value
+        
+    def get_world_state(self, key):
+        return self.world_state.get(key)
+        
+    def search_short_term(self, query, limit=10):
+        return []
+        
+    def search_long_term(self, query, limit=10):
+        return []
+        
+    def batch(self, items):
+        self.batches += 1
+        for op, key, value in items:
+            getattr(self, op)(key, value)
+
+
+class Worker(Agent):
+    __slots__ = ()
+    
+    async def execute(self):
+        await self.report_progress({"status": "completed", "output": "done"})
+
+
+class AsyncAssigner(Worker):
+    __slots__ = ("assigned",)
+    
+    async def assign_task(self, task):
+        self.assigned = task["id"]
+        return await super().assign_task(task)
+
+
+def make_orchestrator():
+    memory = Memory()
+    orchestrator = TaskOrchestrator(memory)
+    coder = Worker("Coder", ["code_generation"], memory)
+    tester = Worker("Tester", ["test_writing"], memory)
+    orchestrator.register_agents([coder, tester])
+    return orchestrator, memory, coder, tester
+
+
+@pytest.mark.asyncio
+async def test_completion_assigns_unlocked_dependent_within_the_callback():
+    orchestrator, memory, coder, tester = make_orchestrator()
+    code_id = orchestrator.create_task("code", [], ["code_generation"])
+    test_id = orchestrator.create_task("test", [], ["test_writing"], dependencies=[code_id])
+    
+    assert await orchestrator.assign_tasks() == 1
+    assert coder.current_task["id"] == code_id
+    assert tester.current_task is None
+    
+    # The completion callback alone must hand the dependent to the tester
+    await coder.execute()
+    
+    assert orchestrator.task_queue.get_task(code_id).status == "completed"
+    assert tester.current_task["id"] == test_id
+    assert orchestrator.task_queue.get_task(test_id).assigned_to == tester.id
+    assert memory.long_term[f"task:{code_id}"]["status"] == "completed"
+    assert memory.world_state[f"task_progress:{code_id}"]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_overridden_assign_task_is_awaited():
+    memory = Memory()
+    orchestrator = TaskOrchestrator(memory)
+    agent = AsyncAssigner("Async", ["code_generation"], memory)
+    orchestrator.register_agent(agent)
+    task_id = orchestrator.create_task("code", [], ["code_generation"])
+    
+    assert await orchestrator.assign_tasks() == 1
+    assert agent.assigned == task_id
+    assert agent.current_task["id"] == task_id
+
+
+@pytest.mark.asyncio
+async def test_progress_reported_from_a_thread_is_drained():
+    orchestrator, memory, coder, tester = make_orchestrator()
+    task_id = orchestrator.create_task("code", [], ["code_generation"])
+    await orchestrator.assign_tasks()
+    
+    thread = threading.Thread(
+        target=coder.report_progress_sync,
+        args=({"status": "completed", "output": "done"},),
+    )
+    thread.start()
+    thread.join()
+    
+    # Nothing is applied until the orchestrator drains the queue
+    assert len(orchestrator.progress_events) == 1
+    assert orchestrator.task_queue.get_task(task_id).status == "assigned"
+    
+    assert orchestrator.drain_progress_events() == 1
+    orchestrator._flush_writes()
+    
+    assert orchestrator.task_queue.get_task(task_id).status == "completed"
+    assert orchestrator.agent_status_counts == {"idle": 2, "working": 0}
+    assert memory.long_term[f"task:{task_id}"]["status"] == "completed"
+
+
+async def wait_until(predicate, timeout=1.0):
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0.01)
+    await asyncio.wait_for(poll(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_progress_from_a_thread_wakes_run():
+    orchestrator, memory, coder, tester = make_orchestrator()
+    task_id = orchestrator.create_task("code", [], ["code_generation"])
+    
+    # Far longer than the test waits, so only the wake-up can finish the task
+    runner = asyncio.create_task(orchestrator.run(interval=60))
+    try:
+        await wait_until(lambda: coder.current_task is not None)
+        
+        thread = threading.Thread(
+            target=coder.report_progress_sync,
+            args=({"status": "completed", "output": "done"},),
+        )
+        thread.start()
+        thread.join()
+        
+        await wait_until(lambda: orchestrator.task_queue.get_task(task_id).status == "completed")
+    finally:
+        runner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await runner
+            
+    assert orchestrator.progress_events.waker is None
+
+
+@pytest.mark.asyncio
+async def test_monitor_progress_picks_up_world_state_fallback():
+    orchestrator, memory, coder, tester = make_orchestrator()
+    task_id = orchestrator.create_task("code", [], ["code_generation"])
+    await orchestrator.assign_tasks()
+    
+    # A full queue sends the report to world state instead
+    coder.progress_queue = ProgressQueue(capacity=0)
+    coder.report_progress_sync({"status": "failed", "message": "boom"})
+    assert memory.world_state[f"task_progress:{task_id}"]["status"] == "failed"
+    assert orchestrator.task_queue.get_task(task_id).status == "assigned"
+    
+    await orchestrator.monitor_progress()
+    
+    task = orchestrator.task_queue.get_task(task_id)
+    assert task.status == "failed"
+    assert task.result["message"] == "boom"
+    assert orchestrator._assignments == {}
+    assert orchestrator.agent_status_counts["idle"] == 2
+    assert memory.long_term[f"task:{task_id}"]["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_system_status_reports_task_and_agent_counts():
+    orchestrator, memory, coder, tester = make_orchestrator()
+    orchestrator.create_task("code", [], ["code_generation"])
+    orchestrator.create_task("more code", [], ["code_generation"])
+    orchestrator.create_task("test", [], ["test_writing"])
+    await orchestrator.assign_tasks()
+    await tester.execute()
+    
+    batches = memory.batches
+    orchestrator.update_system_state()
+    
+    status = memory.world_state["system:status"]
+    assert status["tasks"] == {"pending": 1, "assigned": 1, "completed": 1, "failed": 0}
+    assert status["agents"] == {"idle": 1, "working": 1}
+    assert memory.batches == batches + 1
@@ -0,0 +1,32 @@
+import pytest
+
+from src.core import utils
+from src.core.task import Task
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_round_trips_with_either_backend(monkeypatch, use_orjson):
+    if use_orjson and utils.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+        
+    task = Task("task", ["req"], ["code_generation"], priority=3, context={1: "x"})
+    restored = Task.from_json(task.to_json())
+    
+    assert restored.id == task.id
+    assert restored.priority == 3
+    assert restored.required_capabilities_set == frozenset(["code_generation"])
+    # Non-string keys come back as strings from both backends
+    assert restored.context == {"1": "x"}
+
+
+def test_to_dict_results_do_not_share_the_cache():
+    task = Task("task", [])
+    record = task.to_dict()
+    record["status"] = "completed"
+    record["completed_at"] = "now"
+    
+    again = task.to_dict()
+    assert again["status"] == "pending"
+    assert "completed_at" not in again
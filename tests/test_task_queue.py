@@ -0,0 +1,180 @@
+from src.core.task import Task, TaskQueue
+
+
+def make_task(priority=1, dependencies=None, capabilities=None):
+    return Task(
+        description="task",
+        requirements=[],
+        required_capabilities=capabilities,
+        priority=priority,
+        dependencies=dependencies,
+    )
+
+
+def test_failed_then_retried_dependent_is_scheduled_once_unblocked():
+    queue = TaskQueue()
+    a = make_task()
+    b = make_task(dependencies=[a.id])
+    queue.add_task(a)
+    queue.add_task(b)
+    
+    # B never had a heap entry while blocked; leaving and re-entering
+    # pending must not keep it out of the heap once A completes
+    queue.update_task(b.id, {"status": "failed"})
+    queue.update_task(b.id, {"status": "pending"})
+    queue.update_task(a.id, {"status": "completed"})
+    
+    assert b.unmet_deps == 0
+    assert queue.get_next_task([]) is b
+
+
+def test_dependent_retried_after_its_dependency_completes_is_scheduled():
+    queue = TaskQueue()
+    a = make_task()
+    b = make_task(dependencies=[a.id])
+    queue.add_task(a)
+    queue.add_task(b)
+    
+    # B is archived while A completes, so it must still be unblocked
+    queue.update_task(b.id, {"status": "failed"})
+    queue.update_task(a.id, {"status": "completed"})
+    queue.update_task(b.id, {"status": "pending"})
+    
+    assert b.unmet_deps == 0
+    assert queue.get_next_task([]) is b
+
+
+def test_priority_update_reorders_ready_tasks():
+    queue = TaskQueue()
+    older = make_task(priority=1)
+    newer = make_task(priority=1)
+    queue.add_task(older)
+    queue.add_task(newer)
+    
+    queue.update_task(newer.id, {"priority": 100})
+    
+    assert queue.get_next_task([]) is newer
+
+
+def test_ready_tasks_come_out_by_priority_then_age():
+    queue = TaskQueue()
+    low = make_task(priority=1)
+    high = make_task(priority=5)
+    high_later = make_task(priority=5)
+    for task in (low, high_later, high):
+        queue.add_task(task)
+        
+    assert list(queue.ready_tasks()) == [high, high_later, low]
+    
+    # Iterating must leave the queue intact
+    assert queue.get_next_task([]) is high
+
+
+def test_equal_priority_and_timestamp_keep_insertion_order():
+    queue = TaskQueue()
+    tasks = [make_task() for _ in range(20)]
+    for n, task in enumerate(tasks):
+        # Coarse clocks and restored tasks can share a timestamp; the IDs
+        # sort differently as strings ("t10" before "t2")
+        task.id = f"t{n:x}"
+        task.created_at = 1000.0
+        queue.add_task(task)
+        
+    assert list(queue.ready_tasks()) == tasks
+    
+    # A requeued task keeps its place instead of moving to the back
+    queue.update_task(tasks[0].id, {"status": "assigned"})
+    queue.update_task(tasks[0].id, {"status": "pending"})
+    assert list(queue.ready_tasks()) == tasks
+
+
+def test_get_next_task_filters_by_capability():
+    queue = TaskQueue()
+    needs_code = make_task(priority=5, capabilities=["code_generation"])
+    anyone = make_task(priority=1)
+    queue.add_task(needs_code)
+    queue.add_task(anyone)
+    
+    assert queue.get_next_task(["test_writing"]) is anyone
+    assert queue.get_next_task(["code_generation"]) is needs_code
+
+
+def test_dependents_are_ready_only_once_all_dependencies_complete():
+    queue = TaskQueue()
+    a = make_task()
+    b = make_task()
+    c = make_task(priority=10, dependencies=[a.id, b.id])
+    for task in (a, b, c):
+        queue.add_task(task)
+        
+    assert c not in list(queue.ready_tasks())
+    
+    queue.update_task(a.id, {"status": "completed"})
+    assert c.unmet_deps == 1
+    assert c not in list(queue.ready_tasks())
+    
+    queue.update_task(b.id, {"status": "completed"})
+    assert c.unmet_deps == 0
+    assert queue.get_next_task([]) is c
+
+
+def test_dependency_completed_before_the_dependent_is_added():
+    queue = TaskQueue()
+    a = make_task()
+    queue.add_task(a)
+    queue.update_task(a.id, {"status": "completed"})
+    
+    b = make_task(dependencies=[a.id])
+    queue.add_task(b)
+    
+    assert b.unmet_deps == 0
+    assert queue.get_next_task([]) is b
+
+
+def test_finished_tasks_move_to_the_archive_and_back():
+    queue = TaskQueue()
+    task = make_task()
+    queue.add_task(task)
+    
+    queue.update_task(task.id, {"status": "completed"})
+    assert task.id not in queue.tasks
+    assert queue.archive[task.id] is task
+    assert queue.get_task(task.id) is task
+    assert queue.get_next_task([]) is None
+    
+    # Re-opening a finished task brings it back into the live set
+    queue.update_task(task.id, {"status": "pending"})
+    assert task.id not in queue.archive
+    assert queue.tasks[task.id] is task
+    assert queue.get_next_task([]) is task
+
+
+def test_assigned_task_returned_to_pending_is_requeued():
+    queue = TaskQueue()
+    task = make_task()
+    queue.add_task(task)
+    
+    queue.update_task(task.id, {"status": "assigned", "assigned_to": "agent"})
+    assert queue.get_next_task([]) is None
+    
+    queue.update_task(task.id, {"status": "pending", "assigned_to": None})
+    assert queue.get_next_task([]) is task
+    assert list(queue.ready_tasks()) == [task]
+
+
+def test_status_counts_follow_transitions():
+    queue = TaskQueue()
+    a = make_task()
+    b = make_task(dependencies=[a.id])
+    queue.add_task(a)
+    queue.add_task(b)
+    assert queue.status_counts == {"pending": 2}
+    
+    queue.update_task(a.id, {"status": "assigned"})
+    queue.update_task(b.id, {"status": "failed"})
+    assert queue.status_counts == {"pending": 0, "assigned": 1, "failed": 1}
+    
+    queue.update_task(b.id, {"status": "pending"})
+    queue.update_task(a.id, {"status": "completed"})
+    assert queue.status_counts == {"pending": 1, "assigned": 0, "failed": 0, "completed": 1}
+    assert queue.get_next_task([]) is b